@@ -2,7 +2,7 @@
 ImageCanvas - QGraphicsView 기반 이미지 캔버스 위젯.
 
 기능:
-- 이미지 로드 및 표시 (파일 선택 / 드래그 앤 드롭)
+- 이미지 로드 및 표시 (파일 선택 / 드래그 앤 드롭, 백그라운드 디코딩)
 - 빈 화면에 안내 문구 표시
 - Hand 모드 / Point 모드 전환
 - 실시간 마우스 좌표 표시 (커서 옆 오버레이)
@@ -13,38 +13,83 @@ ImageCanvas - QGraphicsView 기반 이미지 캔버스 위젯.
 - 더블클릭 원본 크기 복원 (Hand 모드에서만)
 """
 
+import functools
+from array import array
 from enum import Enum
 
 from PySide6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
-    QGraphicsPixmapItem,
-    QGraphicsEllipseItem,
     QGraphicsTextItem,
-    QGraphicsRectItem,
-    QGraphicsLineItem,
+    QGraphicsItem,
+)
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QObject,
+    QPointF,
+    QLineF,
+    QRect,
+    QRectF,
+    QSize,
+    QTimer,
+    QRunnable,
+    QThreadPool,
 )
-from PySide6.QtCore import Qt, Signal, QPointF
 from PySide6.QtGui import (
     QPixmap,
+    QImage,
+    QImageReader,
+    QImageIOHandler,
     QPen,
     QBrush,
     QColor,
     QFont,
+    QFontMetricsF,
     QWheelEvent,
     QMouseEvent,
     QDragEnterEvent,
     QDropEvent,
     QPainter,
     QCursor,
+    QSurfaceFormat,
+    QOpenGLContext,
+    QStaticText,
     QTransform,
 )
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # OpenGL 모듈 없이 빌드된 PySide6 — 래스터 뷰포트 사용
+    QOpenGLWidget = None
+
 
 POINT_RADIUS = 4
 ZOOM_FACTOR = 1.15
 MIN_ZOOM = 0.05
 MAX_ZOOM = 50.0
+MOVE_COALESCE_MS = 16  # 호버 표시 갱신 간격 (~60Hz, 한 프레임)
+MAX_DIM = 16384  # 표시용 픽스맵 최대 변 길이 (GPU 텍스처 한계)
+DECODE_LIMIT_MB = 2048  # 디코딩 허용 메모리 (Qt 기본 256MB로는 16K급 PNG/TIFF가 거부됨)
+DISPLAY_OVERSAMPLE = 2  # 축소 캐시 픽스맵 크기 = 뷰포트 × 이 배율
+
+_IDENTITY = QTransform()  # 매번 새로 만들지 않고 공유하는 단위 변환
+
+# 마커/오버레이 공용 펜·브러시·폰트 — 마커를 만들 때마다 새로 만들지 않음
+_POINT_PEN = QPen(QColor(255, 50, 50), 1.5)
+_POINT_BRUSH = QBrush(QColor(255, 50, 50, 200))
+_POINT_LABEL_BRUSH = QBrush(QColor(200, 50, 50, 80))
+_BOX_PEN = QPen(QColor(50, 255, 50), 3.5)
+_BOX_LABEL_BRUSH = QBrush(QColor(50, 200, 50, 80))
+_BOX_START_PEN = QPen(QColor(50, 255, 50), 1.5)
+_BOX_START_BRUSH = QBrush(QColor(50, 255, 50, 200))
+_BOX_PREVIEW_PEN = QPen(QColor(50, 255, 50, 150), 3.5)
+_CROSSHAIR_PEN = QPen(QColor(255, 255, 255, 100), 3.5, Qt.PenStyle.DashLine)
+_LABEL_TEXT_PEN = QPen(QColor(255, 255, 255))
+_HUD_BRUSH = QBrush(QColor(0, 0, 0, 80))
+# QFont는 글꼴 설명값일 뿐 — 실제 글꼴 해석은 그릴 때(QApplication 생성 후) 이루어짐
+MONO_FONT = QFont("Monospace", 13)  # 포인트 라벨, 좌표 표시, 단축키 가이드
+_BOX_LABEL_FONT = QFont("Monospace", 11)
 
 
 class Mode(Enum):
@@ -53,15 +98,18 @@ class Mode(Enum):
     BOX = "box"
 
 
-def _make_point_cursor() -> QCursor:
-    """빨간 십자선 커서 생성."""
+def _make_cross_cursor(line_color: QColor, dot_color: QColor) -> QCursor:
+    """십자선 커서 생성 (HiDPI 대응 2배 해상도).
+
+    premultiplied ARGB32 QImage에 그려 변환 없이 QPixmap으로 옮김.
+    축 정렬 선뿐이라 안티에일리어싱은 쓰지 않음.
+    """
     size = 24
-    pm = QPixmap(size, size)
-    pm.fill(QColor(0, 0, 0, 0))
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    pen = QPen(QColor(255, 50, 50, 200), 1.2)
-    painter.setPen(pen)
+    img = QImage(size * 2, size * 2, QImage.Format.Format_ARGB32_Premultiplied)
+    img.setDevicePixelRatio(2.0)
+    img.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(img)
+    painter.setPen(QPen(line_color, 1.2))
     center = size // 2
     arm = 8
     # 십자선
@@ -70,269 +118,379 @@ def _make_point_cursor() -> QCursor:
     painter.drawLine(center, center - arm, center, center - 2)
     painter.drawLine(center, center + 2, center, center + arm)
     # 중심 점
-    painter.setPen(QPen(QColor(255, 50, 50, 220), 1.5))
+    painter.setPen(QPen(dot_color, 1.5))
     painter.drawPoint(center, center)
     painter.end()
-    return QCursor(pm, center, center)
+    return QCursor(QPixmap.fromImage(img), center, center)
 
 
-def _make_box_cursor() -> QCursor:
-    """초록색 십자선 커서 생성 (Box 모드용)."""
-    size = 24
-    pm = QPixmap(size, size)
-    pm.fill(QColor(0, 0, 0, 0))
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    pen = QPen(QColor(50, 255, 50, 200), 1.2)
-    painter.setPen(pen)
-    center = size // 2
-    arm = 8
-    # 십자선
-    painter.drawLine(center - arm, center, center - 2, center)
-    painter.drawLine(center + 2, center, center + arm, center)
-    painter.drawLine(center, center - arm, center, center - 2)
-    painter.drawLine(center, center + 2, center, center + arm)
-    # 중심 점
-    painter.setPen(QPen(QColor(50, 255, 50, 220), 1.5))
-    painter.drawPoint(center, center)
-    painter.end()
-    return QCursor(pm, center, center)
-
-
-class CoordOverlay:
-    """마우스 커서 옆에 좌표를 표시하는 오버레이 (줌 무관 고정 크기)."""
-
-    def __init__(self, scene: QGraphicsScene):
-        self._bg = QGraphicsRectItem()
-        self._bg.setBrush(QBrush(QColor(0, 0, 0, 80)))
-        self._bg.setPen(QPen(Qt.NoPen))
-        self._bg.setZValue(1000)
-        self._bg.setVisible(False)
-        self._bg.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIgnoresTransformations)
-        scene.addItem(self._bg)
-
-        self._text = QGraphicsTextItem()
-        self._text.setDefaultTextColor(QColor(255, 255, 255))
-        self._text.setFont(QFont("Monospace", 13))
-        self._text.setZValue(1001)
-        self._text.setVisible(False)
-        self._text.setFlag(QGraphicsTextItem.GraphicsItemFlag.ItemIgnoresTransformations)
-        scene.addItem(self._text)
-
-    def update(self, scene_pos: QPointF, img_x: int, img_y: int):
-        label = f"({img_x}, {img_y})"
-        self._text.setPlainText(label)
-
-        self._text.setPos(scene_pos)
-        self._bg.setPos(scene_pos)
-
-        rect = self._text.boundingRect()
-        offset_x, offset_y = 20, -40
-
-        padding = 3
-        self._bg.setRect(
-            offset_x - padding,
-            offset_y - padding,
-            rect.width() + padding * 2,
-            rect.height() + padding * 2,
-        )
+def _make_point_cursor() -> QCursor:
+    """빨간 십자선 커서 생성."""
+    return _make_cross_cursor(QColor(255, 50, 50, 200), QColor(255, 50, 50, 220))
 
-        t = QTransform()
-        t.translate(offset_x, offset_y)
-        self._text.setTransform(t)
 
-        t_bg = QTransform()
-        self._bg.setTransform(t_bg)
+def _make_box_cursor() -> QCursor:
+    """초록색 십자선 커서 생성 (Box 모드용)."""
+    return _make_cross_cursor(QColor(50, 255, 50, 200), QColor(50, 255, 50, 220))
 
-        self._bg.setVisible(True)
-        self._text.setVisible(True)
 
-    def hide(self):
-        self._bg.setVisible(False)
-        self._text.setVisible(False)
+@functools.lru_cache(maxsize=1)
+def _point_cursor() -> QCursor:
+    """포인트 모드 커서 — 모듈 단위로 한 번만 생성해 모든 캔버스가 공유."""
+    return _make_point_cursor()
 
-    def remove(self, scene: QGraphicsScene):
-        scene.removeItem(self._bg)
-        scene.removeItem(self._text)
 
+@functools.lru_cache(maxsize=1)
+def _box_cursor() -> QCursor:
+    """Box 모드 커서 — 포인트 커서와 마찬가지로 한 번만 생성."""
+    return _make_box_cursor()
 
-class Crosshair:
-    """마우스 위치에 표시되는 십자선 가이드."""
 
-    def __init__(self, scene: QGraphicsScene):
-        pen = QPen(QColor(255, 255, 255, 100), 3.5, Qt.PenStyle.DashLine)
+@functools.lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    """OpenGL 뷰포트 사용 가능 여부 (원격 데스크톱/오프스크린 등은 불가)."""
+    if QOpenGLWidget is None:
+        return False
+    return QOpenGLContext().create()
 
-        self._h_line = QGraphicsLineItem()
-        self._h_line.setPen(pen)
-        self._h_line.setZValue(999)
-        self._h_line.setVisible(False)
-        scene.addItem(self._h_line)
 
-        self._v_line = QGraphicsLineItem()
-        self._v_line.setPen(pen)
-        self._v_line.setZValue(999)
-        self._v_line.setVisible(False)
-        scene.addItem(self._v_line)
+class _LoadSignals(QObject):
+    """_LoadTask 결과를 GUI 스레드로 전달."""
 
-    def update(self, scene_pos: QPointF, img_w: int, img_h: int):
-        x, y = scene_pos.x(), scene_pos.y()
-        self._h_line.setLine(0, y, img_w, y)
-        self._v_line.setLine(x, 0, x, img_h)
-        self._h_line.setVisible(True)
-        self._v_line.setVisible(True)
+    # (요청 id, 경로, 이미지, 축소본 — 필요 없으면 null, 원본 크기)
+    finished = Signal(int, str, QImage, QImage, QSize)
 
-    def hide(self):
-        self._h_line.setVisible(False)
-        self._v_line.setVisible(False)
 
-    def remove(self, scene: QGraphicsScene):
-        scene.removeItem(self._h_line)
-        scene.removeItem(self._v_line)
+class _LoadTask(QRunnable):
+    """워커 스레드에서 이미지 디코딩 + 표시용 축소본 생성
+    (QPixmap 변환은 GUI 스레드에서)."""
 
+    def __init__(
+        self, request_id: int, path: str, display_limit: QSize, signals: _LoadSignals
+    ):
+        super().__init__()
+        self._request_id = request_id
+        self._path = path
+        self._display_limit = display_limit  # 이보다 크면 축소본을 만듦
+        self._signals = signals
 
-class PointMarker:
-    """이미지 위에 표시되는 포인트 마커 (원 + 좌표 텍스트, 줌 무관 고정 크기)."""
+    def run(self):
+        # 축소 전 원본 전체를 디코딩하는 포맷이 있으므로 원본 크기 기준 한도가 필요
+        QImageReader.setAllocationLimit(DECODE_LIMIT_MB)
+        reader = QImageReader(self._path)
+        reader.setAutoTransform(True)
 
-    def __init__(self, scene: QGraphicsScene, img_x: int, img_y: int):
-        self.img_x = img_x
-        self.img_y = img_y
+        # 초대형 이미지는 디코딩 단계에서 바로 축소
+        raw = reader.size()
+        source = QSize(raw)
+        if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+            source.transpose()
+        if raw.isValid() and (raw.width() > MAX_DIM or raw.height() > MAX_DIM):
+            reader.setScaledSize(
+                raw.scaled(MAX_DIM, MAX_DIM, Qt.AspectRatioMode.KeepAspectRatio)
+            )
 
-        # 빨간 원 — 줌 무관
-        r = POINT_RADIUS
-        self._circle = QGraphicsEllipseItem(-r, -r, r * 2, r * 2)
-        self._circle.setPos(img_x, img_y)
-        self._circle.setPen(QPen(QColor(255, 50, 50), 1.5))
-        self._circle.setBrush(QBrush(QColor(255, 50, 50, 200)))
-        self._circle.setZValue(100)
-        self._circle.setFlag(
-            QGraphicsEllipseItem.GraphicsItemFlag.ItemIgnoresTransformations
+        image = reader.read()
+        if not image.isNull() and not raw.isValid():
+            # 헤더에서 크기를 알 수 없는 포맷 — 디코딩 후 축소
+            source = image.size()
+            if source.width() > MAX_DIM or source.height() > MAX_DIM:
+                image = image.scaled(
+                    MAX_DIM,
+                    MAX_DIM,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+
+        # 축소 보기용 사본도 여기서 만들어 GUI 스레드의 부드러운 축소 비용을 없앰
+        display = QImage()
+        limit = self._display_limit
+        if not image.isNull() and (
+            image.width() > limit.width() or image.height() > limit.height()
+        ):
+            display = image.scaled(
+                limit,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        try:
+            self._signals.finished.emit(self._request_id, self._path, image, display, source)
+        except RuntimeError:
+            # 디코딩 중 캔버스가 파괴됨 — 받을 곳이 없으므로 결과 폐기
+            pass
+
+
+class CoordHud:
+    """마우스 커서 옆 좌표 표시 (씬 아이템 없이 drawForeground에서 그림).
+
+    기준점(커서) 상대 뷰포트 픽셀 좌표로 배경 + 텍스트를 그림.
+    텍스트는 QStaticText로 좌표가 바뀔 때만 레이아웃.
+    """
+
+    OFFSET_X, OFFSET_Y = 20, -40
+    PADDING = 3
+    TEXT_MARGIN = 4
+
+    def __init__(self):
+        self._metrics = QFontMetricsF(MONO_FONT)
+        self._static = QStaticText()
+        self._static.setTextFormat(Qt.TextFormat.PlainText)
+        self._coord: tuple[int, int] | None = None
+        self._label_len = 0
+
+        inset = self.PADDING + self.TEXT_MARGIN
+        self._text_pos = QPointF(
+            self.OFFSET_X + self.TEXT_MARGIN,
+            self.OFFSET_Y + self.TEXT_MARGIN,
         )
-        scene.addItem(self._circle)
-
-        # 좌표 라벨 — 줌 무관
-        label = f"({img_x}, {img_y})"
-        self._label_text = QGraphicsTextItem()
-        self._label_text.setPlainText(label)
-        self._label_text.setDefaultTextColor(QColor(255, 255, 255))
-        self._label_text.setFont(QFont("Monospace", 13))
-        self._label_text.setZValue(102)
-        self._label_text.setPos(img_x, img_y)
-        self._label_text.setFlag(
-            QGraphicsTextItem.GraphicsItemFlag.ItemIgnoresTransformations
+        self._bg_rect = QRectF(
+            self.OFFSET_X - self.PADDING,
+            self.OFFSET_Y - self.PADDING,
+            0,
+            self._metrics.height() + inset * 2,
+        )
+        # 가장 긴 라벨 기준으로 미리 계산한 영역 (갱신 영역 계산용)
+        self.bounds = QRectF(self._bg_rect)
+        self.bounds.setWidth(self._metrics.horizontalAdvance("(99999, 99999)") + inset * 2)
+
+    def set_coord(self, img_x: int, img_y: int):
+        # 라벨은 좌표가 바뀔 때만 다시 생성
+        if (img_x, img_y) != self._coord:
+            self._coord = (img_x, img_y)
+            label = f"({img_x}, {img_y})"
+            self._static.setText(label)
+            self._static.prepare(_IDENTITY, MONO_FONT)
+            # 숫자 폭은 고정이므로 자릿수(글자 수)가 바뀔 때만 배경 폭 갱신
+            if len(label) != self._label_len:
+                self._label_len = len(label)
+                inset = self.PADDING + self.TEXT_MARGIN
+                self._bg_rect.setWidth(self._static.size().width() + inset * 2)
+
+    def draw(self, painter: QPainter, origin: QPointF):
+        """origin(뷰포트 픽셀)을 기준점으로 그림."""
+        painter.fillRect(self._bg_rect.translated(origin), _HUD_BRUSH)
+        painter.setFont(MONO_FONT)
+        painter.setPen(_LABEL_TEXT_PEN)
+        painter.drawStaticText(self._text_pos + origin, self._static)
+
+
+class StaticLabel:
+    """배경 + 텍스트 라벨 (뷰포트 픽셀 단위, 기준점 상대 좌표).
+
+    줄마다 QStaticText로 미리 레이아웃해 두고 drawStaticText로 그림.
+    """
+
+    PADDING = 2
+
+    def __init__(self, text: str, font: QFont, bg_brush: QBrush, offset: QPointF):
+        self._font = font
+        self._bg_brush = bg_brush
+
+        # QStaticText는 개행을 처리하지 않으므로 줄마다 하나씩
+        line_height = QFontMetricsF(font).lineSpacing()
+        x, y = offset.x(), offset.y()
+        width = 0.0
+        self._lines: list[tuple[QPointF, QStaticText]] = []
+        for i, line in enumerate(text.split("\n")):
+            static = QStaticText(line)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            # 마커 라벨은 생성 후 바뀌지 않으므로 글리프 캐시를 최대한 유지
+            static.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            static.prepare(_IDENTITY, font)
+            width = max(width, static.size().width())
+            self._lines.append((QPointF(x, y + i * line_height), static))
+
+        pad = self.PADDING
+        self.rect = QRectF(
+            x - pad,
+            y - pad,
+            width + pad * 2,
+            line_height * len(self._lines) + pad * 2,
         )
-        scene.addItem(self._label_text)
-
-        # 라벨 배경 — 줌 무관
-        self._label_bg = QGraphicsRectItem()
-        self._label_bg.setBrush(QBrush(QColor(200, 50, 50, 80)))
-        self._label_bg.setPen(QPen(Qt.NoPen))
-        self._label_bg.setZValue(101)
-        self._label_bg.setPos(img_x, img_y)
-        self._label_bg.setFlag(
-            QGraphicsRectItem.GraphicsItemFlag.ItemIgnoresTransformations
+
+    def draw(self, painter: QPainter, origin: QPointF):
+        """origin(뷰포트 픽셀)을 기준점으로 라벨을 그림."""
+        painter.fillRect(self.rect.translated(origin), self._bg_brush)
+        painter.setFont(self._font)
+        painter.setPen(_LABEL_TEXT_PEN)
+        for pos, static in self._lines:
+            painter.drawStaticText(pos + origin, static)
+
+
+class MarkersLayer(QGraphicsItem):
+    """모든 포인트/Box 마커를 그리는 단일 아이템.
+
+    마커마다 씬 아이템을 만들지 않고, paint()에서 노출 영역에 걸친 마커만 그림.
+    포인트 원과 라벨은 줌 무관 고정 크기, Box 테두리는 이미지와 함께 확대.
+    """
+
+    LABEL_EXTENT = 240  # 라벨이 기준점에서 뻗을 수 있는 최대 거리 (뷰포트 픽셀)
+
+    def __init__(self):
+        super().__init__()
+        self.setZValue(100)
+        # paint()에서 option.exposedRect로 컬링
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+        self._image_rect = QRectF()
+        self._bounds = QRectF()
+        self._view_scale = 1.0
+
+        r = POINT_RADIUS + 1  # 펜 두께 여유
+        self._circle_rect = QRectF(-r, -r, r * 2, r * 2)
+
+        # 좌표는 병렬 int 배열(SoA), 라벨/영역은 같은 인덱스의 리스트
+        self._point_x = array("i")
+        self._point_y = array("i")
+        self._point_labels: list[StaticLabel] = []
+        self._point_areas: list[QRectF] = []  # 원 + 라벨 영역 (뷰포트 픽셀)
+        self._box_x1 = array("i")
+        self._box_y1 = array("i")
+        self._box_x2 = array("i")
+        self._box_y2 = array("i")
+        self._box_labels: list[StaticLabel] = []
+        self._point_columns = (
+            self._point_x,
+            self._point_y,
+            self._point_labels,
+            self._point_areas,
         )
-        scene.addItem(self._label_bg)
-
-        # offset (뷰포트 픽셀 단위)
-        text_offset_x = POINT_RADIUS + 6
-        text_offset_y = -8
-
-        t = QTransform()
-        t.translate(text_offset_x, text_offset_y)
-        self._label_text.setTransform(t)
-
-        rect = self._label_text.boundingRect()
-        pad = 2
-        self._label_bg.setRect(
-            -pad,
-            -pad,
-            rect.width() + pad * 2,
-            rect.height() + pad * 2,
+        self._box_columns = (
+            self._box_x1,
+            self._box_y1,
+            self._box_x2,
+            self._box_y2,
+            self._box_labels,
         )
-        t_bg = QTransform()
-        t_bg.translate(text_offset_x - pad, text_offset_y - pad)
-        self._label_bg.setTransform(t_bg)
 
-    def remove(self, scene: QGraphicsScene):
-        scene.removeItem(self._circle)
-        scene.removeItem(self._label_text)
-        scene.removeItem(self._label_bg)
+    # ── 영역 ──
 
+    def set_image_rect(self, width: int, height: int):
+        self._image_rect = QRectF(0, 0, width, height)
+        self._update_bounds()
 
-class BoxMarker:
-    """Bounding box marker (green border + coordinate labels)."""
+    def set_view_scale(self, scale: float):
+        """뷰 배율 변경 시 호출 — 고정 크기 라벨이 차지하는 씬 여유폭 갱신."""
+        if scale > 0 and scale != self._view_scale:
+            self._view_scale = scale
+            self._update_bounds()
 
-    def __init__(self, scene: QGraphicsScene, x1: int, y1: int, x2: int, y2: int):
-        # Normalize coordinates (top-left to bottom-right)
-        self.x1 = min(x1, x2)
-        self.y1 = min(y1, y2)
-        self.x2 = max(x1, x2)
-        self.y2 = max(y1, y2)
-        self.width = abs(x2 - x1)
-        self.height = abs(y2 - y1)
-
-        # Green rectangle (3.5px border, transparent fill)
-        # Box follows image zoom - NO ItemIgnoresTransformations
-        self._rect = QGraphicsRectItem(self.x1, self.y1, self.width, self.height)
-        self._rect.setPen(QPen(QColor(50, 255, 50), 3.5))
-        self._rect.setBrush(QBrush(Qt.BrushStyle.NoBrush))
-        self._rect.setZValue(100)
-        scene.addItem(self._rect)
+    def _update_bounds(self):
+        self.prepareGeometryChange()
+        margin = self.LABEL_EXTENT / self._view_scale
+        self._bounds = self._image_rect.adjusted(-margin, -margin, margin, margin)
 
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    # ── 마커 ──
+
+    def add_point(self, x: int, y: int):
+        label = StaticLabel(
+            f"({x}, {y})",
+            MONO_FONT,
+            _POINT_LABEL_BRUSH,
+            QPointF(POINT_RADIUS + 6, -8),
+        )
+        self._point_x.append(x)
+        self._point_y.append(y)
+        self._point_labels.append(label)
+        self._point_areas.append(label.rect.united(self._circle_rect))
+        self.update()
+
+    def add_box(self, x1: int, y1: int, x2: int, y2: int):
+        # Normalize coordinates (top-left to bottom-right)
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
         # Coordinate label - show all 4 corners + W, H with labels
         label = (
-            f"Xmin,Ymin: ({self.x1},{self.y1})\n"
-            f"Xmax,Ymin: ({self.x2},{self.y1})\n"
-            f"Xmin,Ymax: ({self.x1},{self.y2})\n"
-            f"Xmax,Ymax: ({self.x2},{self.y2})\n"
-            f"W:{self.width} H:{self.height}"
-        )
-        self._label_text = QGraphicsTextItem()
-        self._label_text.setPlainText(label)
-        self._label_text.setDefaultTextColor(QColor(255, 255, 255))
-        self._label_text.setFont(QFont("Monospace", 11))
-        self._label_text.setZValue(102)
-        self._label_text.setPos(self.x1, self.y1)
-        self._label_text.setFlag(
-            QGraphicsTextItem.GraphicsItemFlag.ItemIgnoresTransformations
-        )
-        scene.addItem(self._label_text)
-
-        # Label background (green) - more transparent
-        self._label_bg = QGraphicsRectItem()
-        self._label_bg.setBrush(QBrush(QColor(50, 200, 50, 80)))
-        self._label_bg.setPen(QPen(Qt.NoPen))
-        self._label_bg.setZValue(101)
-        self._label_bg.setPos(self.x1, self.y1)
-        self._label_bg.setFlag(
-            QGraphicsRectItem.GraphicsItemFlag.ItemIgnoresTransformations
+            f"Xmin,Ymin: ({x1},{y1})\n"
+            f"Xmax,Ymin: ({x2},{y1})\n"
+            f"Xmin,Ymax: ({x1},{y2})\n"
+            f"Xmax,Ymax: ({x2},{y2})\n"
+            f"W:{x2 - x1} H:{y2 - y1}"
         )
-        scene.addItem(self._label_bg)
-
-        # Position label with offset (viewport pixels) - above box top-left corner
-        text_offset_x = 6
-        text_offset_y = -80
-
-        t = QTransform()
-        t.translate(text_offset_x, text_offset_y)
-        self._label_text.setTransform(t)
-
-        rect = self._label_text.boundingRect()
-        pad = 2
-        self._label_bg.setRect(
-            -pad,
-            -pad,
-            rect.width() + pad * 2,
-            rect.height() + pad * 2,
+        # Offset (viewport pixels) puts the label above the box top-left corner
+        self._box_x1.append(x1)
+        self._box_y1.append(y1)
+        self._box_x2.append(x2)
+        self._box_y2.append(y2)
+        self._box_labels.append(
+            StaticLabel(label, _BOX_LABEL_FONT, _BOX_LABEL_BRUSH, QPointF(6, -80))
         )
-        t_bg = QTransform()
-        t_bg.translate(text_offset_x - pad, text_offset_y - pad)
-        self._label_bg.setTransform(t_bg)
+        self.update()
+
+    def pop_point(self):
+        for column in self._point_columns:
+            column.pop()
+        self.update()
 
-    def remove(self, scene: QGraphicsScene):
-        scene.removeItem(self._rect)
-        scene.removeItem(self._label_text)
-        scene.removeItem(self._label_bg)
+    def pop_box(self):
+        for column in self._box_columns:
+            column.pop()
+        self.update()
+
+    def clear(self):
+        for column in self._point_columns + self._box_columns:
+            del column[:]
+        self.update()
+
+    def points(self) -> list[tuple[int, int]]:
+        return list(zip(self._point_x, self._point_y))
+
+    def boxes(self) -> list[tuple[int, int, int, int]]:
+        return list(zip(self._box_x1, self._box_y1, self._box_x2, self._box_y2))
+
+    def point_count(self) -> int:
+        return len(self._point_x)
+
+    def box_count(self) -> int:
+        return len(self._box_x1)
+
+    # ── 그리기 ──
+
+    def paint(self, painter: QPainter, option, widget=None):
+        if not self._point_x and not self._box_x1:
+            return
+        exposed = option.exposedRect
+        to_device = painter.worldTransform()
+        device_exposed = to_device.mapRect(exposed)
+
+        painter.save()
+
+        # Box 테두리 — 씬 좌표 (이미지와 함께 확대)
+        half = _BOX_PEN.widthF() / 2
+        painter.setPen(_BOX_PEN)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for x1, y1, x2, y2 in zip(self._box_x1, self._box_y1, self._box_x2, self._box_y2):
+            rect = QRectF(x1, y1, x2 - x1, y2 - y1)
+            if exposed.intersects(rect.adjusted(-half, -half, half, half)):
+                painter.drawRect(rect)
+
+        # 이하 뷰포트 픽셀 좌표 (줌 무관 고정 크기)
+        painter.setWorldTransform(_IDENTITY)
+
+        visible: list[tuple[QPointF, StaticLabel]] = []
+        painter.setPen(_POINT_PEN)
+        painter.setBrush(_POINT_BRUSH)
+        for x, y, label, area in zip(
+            self._point_x, self._point_y, self._point_labels, self._point_areas
+        ):
+            origin = to_device.map(QPointF(x, y))
+            if device_exposed.intersects(area.translated(origin)):
+                painter.drawEllipse(origin, POINT_RADIUS, POINT_RADIUS)
+                visible.append((origin, label))
+
+        for x1, y1, label in zip(self._box_x1, self._box_y1, self._box_labels):
+            origin = to_device.map(QPointF(x1, y1))
+            if device_exposed.intersects(label.rect.translated(origin)):
+                visible.append((origin, label))
+
+        # 라벨은 모든 원/테두리 위에
+        for origin, label in visible:
+            label.draw(painter, origin)
+
+        painter.restore()
 
 
 class ImageCanvas(QGraphicsView):
@@ -342,50 +500,105 @@ class ImageCanvas(QGraphicsView):
     point_added = Signal(int, int)    # 포인트 추가 시그널
     point_undone = Signal()           # 포인트 하나 취소 시그널
     points_cleared = Signal()         # 포인트 전체 삭제 시그널
+    marker_count_changed = Signal(int, int)  # (포인트 수, Box 수) 변경 시그널
     image_dropped = Signal(str)       # 드래그앤드롭 이미지 경로 시그널
+    image_loaded = Signal(str)        # 이미지 로드 완료 시그널
+    image_load_failed = Signal(str)   # 이미지 로드 실패 시그널
     mode_changed = Signal(str)        # 모드 변경 시그널 ("hand" / "point")
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._scene = QGraphicsScene(self)
+        # 픽스맵 + 소수의 오버레이뿐인 정적 씬 — BSP 인덱스 유지 비용이 더 큼.
+        # 마커가 ~500개 이하라는 가정. 그 이상을 다룬다면 BspTreeIndex로 되돌릴 것.
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self._scene)
 
+        if _opengl_available():
+            # OpenGL 뷰포트 — 팬/줌 시 픽스맵 샘플링과 변환을 GPU에서 처리
+            # 마커/십자선은 축 정렬 도형이라 멀티샘플링 불필요
+            gl = QOpenGLWidget()
+            fmt = QSurfaceFormat.defaultFormat()
+            fmt.setSamples(0)
+            gl.setFormat(fmt)
+            self.setViewport(gl)
+            # OpenGL 뷰포트는 부분 업데이트를 지원하지 않음
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            # 래스터 뷰포트 — 바뀐 영역만 다시 그림
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+            # 배경(단색 + 이미지)을 뷰포트 픽스맵에 캐시 — 팬은 스크롤 블릿만 수행.
+            # OpenGL 뷰포트에서는 이미지 샘플링을 GPU에 맡기도록 캐시하지 않음
+            self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+
         # 설정
         self.setMouseTracking(True)
-        self.setRenderHint(self.renderHints())
         self.setDragMode(QGraphicsView.DragMode.NoDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setBackgroundBrush(QBrush(QColor(40, 40, 40)))
+        # 아이템들이 paint()에서 펜/브러시를 직접 설정하므로 save/restore 생략,
+        # 안티에일리어싱을 쓰지 않으므로 갱신 영역 확장도 생략
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+            | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+        )
 
         # 드래그 앤 드롭 활성화
         self.setAcceptDrops(True)
 
         # 상태
-        self._pixmap_item: QGraphicsPixmapItem | None = None
-        self._markers: list[PointMarker] = []
-        self._coord_overlay = CoordOverlay(self._scene)
-        self._crosshair = Crosshair(self._scene)
+        # 이미지는 아이템 대신 drawBackground에서 직접 그림
+        self._bg_pixmap: QPixmap | None = None
+        # 큰 이미지의 뷰포트 크기 축소본 — 축소 보기에서는 이쪽을 샘플링
+        self._display_pixmap: QPixmap | None = None
+        # 포인트/Box 마커 — 단일 아이템이 모두 그림
+        self._markers_layer = MarkersLayer()
+        self._scene.addItem(self._markers_layer)
+        # 좌표 오버레이 — drawForeground에서 뷰포트 좌표로 그림
+        self._hud = CoordHud()
+        self._hud_pos: QPointF | None = None  # 씬 좌표, None이면 숨김
+        # 십자선 가이드 — 씬 아이템 대신 drawForeground에서 직접 그림
+        # 그릴 때 dashOffset을 바꾸므로 공용 펜의 사본 사용
+        self._cross_pen = QPen(_CROSSHAIR_PEN)
+        self._cross_pos: QPointF | None = None
         self._current_zoom = 1.0
         self._has_image = False
+        self._img_w = 0
+        self._img_h = 0
+        self._last_emit = (-1, -1)  # 마지막으로 알린 coord_changed 좌표
+        self._view_to_scene: QTransform | None = None  # 뷰포트 → 씬 역변환 캐시
         self._is_panning = False
         self._pan_start = QPointF()
+        # 고폴링 마우스 이벤트 합치기 — 마지막 위치만 타이머에서 반영
+        self._pending_move_pos: QPointF | None = None  # 뷰포트 좌표
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(MOVE_COALESCE_MS)
+        self._move_timer.timeout.connect(self._apply_pending_move)
+        # 휠 입력 누적 — 한 프레임에 scale() 한 번
+        self._pending_wheel = 0
+        self._wheel_pending = False
+
+        # 백그라운드 이미지 로드 — 가장 최근 요청 결과만 반영
+        self._load_signals = _LoadSignals()
+        self._load_signals.finished.connect(self._on_image_decoded)
+        self._load_request = 0
 
         # 모드
         self._mode = Mode.HAND
-        self._point_cursor = _make_point_cursor()
-        self._box_cursor = _make_box_cursor()
+        self._point_cursor = _point_cursor()
+        self._box_cursor = _box_cursor()
 
         # Box 모드 상태
         self._box_start: QPointF | None = None
-        self._box_temp_point: QGraphicsEllipseItem | None = None
-        self._box_preview: QGraphicsRectItem | None = None
-        self._box_markers: list[BoxMarker] = []
+        # 시작점/미리보기 사각형은 drawForeground에서 직접 그림
+        self._box_preview_rect: QRectF | None = None
 
         # 통합 Undo를 위한 히스토리
-        self._marker_history: list[PointMarker | BoxMarker] = []
+        self._marker_history: list[Mode] = []  # 추가 순서 (Mode.POINT / Mode.BOX)
 
         # 빈 화면 안내 텍스트
         self._placeholder = QGraphicsTextItem()
@@ -400,6 +613,7 @@ class ImageCanvas(QGraphicsView):
         self._center_placeholder()
 
     def resizeEvent(self, event):
+        self._view_to_scene = None
         super().resizeEvent(event)
         if not self._has_image:
             self._center_placeholder()
@@ -425,13 +639,17 @@ class ImageCanvas(QGraphicsView):
             self._cleanup_box_state()
 
         self._mode = mode
-        if mode == Mode.HAND:
+        self._restore_cursor()
+        self.mode_changed.emit(mode.value)
+
+    def _restore_cursor(self):
+        """현재 모드에 맞는 커서로 복원."""
+        if self._mode == Mode.HAND:
             self.setCursor(Qt.CursorShape.ArrowCursor)
-        elif mode == Mode.POINT:
+        elif self._mode == Mode.POINT:
             self.setCursor(self._point_cursor)
         else:  # Mode.BOX
             self.setCursor(self._box_cursor)
-        self.mode_changed.emit(mode.value)
 
     def toggle_mode(self):
         if self._mode == Mode.HAND:
@@ -443,27 +661,23 @@ class ImageCanvas(QGraphicsView):
 
     # ──────────────────── Box Mode Helpers ────────────────────
 
-    def _create_temp_point(self, x: int, y: int):
-        """Create green temporary point for box start."""
-        r = POINT_RADIUS
-        self._box_temp_point = QGraphicsEllipseItem(-r, -r, r * 2, r * 2)
-        self._box_temp_point.setPos(x, y)
-        self._box_temp_point.setPen(QPen(QColor(50, 255, 50), 1.5))
-        self._box_temp_point.setBrush(QBrush(QColor(50, 255, 50, 200)))
-        self._box_temp_point.setZValue(99)
-        self._box_temp_point.setFlag(
-            QGraphicsEllipseItem.GraphicsItemFlag.ItemIgnoresTransformations
-        )
-        self._scene.addItem(self._box_temp_point)
-
-    def _create_box_preview(self):
-        """Create preview rectangle for box mode."""
-        self._box_preview = QGraphicsRectItem()
-        self._box_preview.setPen(QPen(QColor(50, 255, 50, 150), 3.5))
-        self._box_preview.setBrush(QBrush(Qt.BrushStyle.NoBrush))
-        self._box_preview.setZValue(99)
-        # No ItemIgnoresTransformations - box follows image zoom
-        self._scene.addItem(self._box_preview)
+    def _box_preview_rects(self) -> list[QRect]:
+        """Viewport areas covered by the box start point and preview."""
+        rects = []
+        if self._box_start is not None:
+            center = self.mapFromScene(self._box_start)
+            r = POINT_RADIUS + 2
+            rects.append(QRect(center.x() - r, center.y() - r, r * 2 + 1, r * 2 + 1))
+        if self._box_preview_rect is not None:
+            half = _BOX_PREVIEW_PEN.widthF() / 2
+            area = self._box_preview_rect.adjusted(-half, -half, half, half)
+            rects.append(self.mapFromScene(area).boundingRect().adjusted(-1, -1, 1, 1))
+        return rects
+
+    def _invalidate_box_preview(self):
+        viewport = self.viewport()
+        for rect in self._box_preview_rects():
+            viewport.update(rect)
 
     def _update_box_preview(self, start: QPointF, current: QPointF):
         """Update preview box from start to current position."""
@@ -474,109 +688,186 @@ class ImageCanvas(QGraphicsView):
         width = abs(x2 - x1)
         height = abs(y2 - y1)
         # Use scene coordinates directly
-        self._box_preview.setRect(left, top, width, height)
-        self._box_preview.setVisible(True)
+        rect = QRectF(left, top, width, height)
+        if rect != self._box_preview_rect:
+            self._invalidate_box_preview()
+            self._box_preview_rect = rect
+            self._invalidate_box_preview()
 
     def _cleanup_box_state(self):
         """Clear box mode temporary state."""
+        self._invalidate_box_preview()
         self._box_start = None
-        if self._box_temp_point:
-            self._scene.removeItem(self._box_temp_point)
-            self._box_temp_point = None
-        if self._box_preview:
-            self._box_preview.setVisible(False)
+        self._box_preview_rect = None
+
+    def _draw_box_preview(self, painter: QPainter):
+        """Paint the in-progress box (scene coords) and its start point (fixed size)."""
+        if self._box_preview_rect is not None:
+            painter.setPen(_BOX_PREVIEW_PEN)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(self._box_preview_rect)
+
+        # Start point ignores zoom - draw in viewport pixels
+        center = painter.worldTransform().map(self._box_start)
+        painter.save()
+        painter.setWorldTransform(_IDENTITY)
+        painter.setPen(_BOX_START_PEN)
+        painter.setBrush(_BOX_START_BRUSH)
+        painter.drawEllipse(center, POINT_RADIUS, POINT_RADIUS)
+        painter.restore()
 
     # ──────────────────── Public API ────────────────────
 
-    def load_image(self, path: str) -> bool:
-        """이미지 파일을 로드하여 캔버스에 표시."""
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            return False
+    def load_image(self, path: str):
+        """이미지 파일을 백그라운드에서 디코딩하여 캔버스에 표시.
+
+        결과는 image_loaded / image_load_failed 시그널로 알린다.
+        """
+        self._load_request += 1
+        self.setCursor(Qt.CursorShape.BusyCursor)
+        # 축소본 크기는 현재 뷰포트의 물리 픽셀 기준
+        limit = self.viewport().size() * (self.devicePixelRatioF() * DISPLAY_OVERSAMPLE)
+        task = _LoadTask(self._load_request, path, limit, self._load_signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_image_decoded(
+        self, request_id: int, path: str, image: QImage, display: QImage, source: QSize
+    ):
+        # 더 최근 로드 요청이 있으면 무시
+        if request_id != self._load_request:
+            return
+        self._restore_cursor()
+        if image.isNull():
+            self.image_load_failed.emit(path)
+            return
+        self._set_pixmap(
+            QPixmap.fromImage(image),
+            None if display.isNull() else QPixmap.fromImage(display),
+            source.width(),
+            source.height(),
+        )
+        self.image_loaded.emit(path)
+
+    def _set_pixmap(
+        self, pixmap: QPixmap, display: QPixmap | None, src_w: int, src_h: int
+    ):
+        """디코딩된 픽스맵을 배경으로 설정. 픽스맵이 원본보다 작으면 확대해 그려
+        씬 좌표가 항상 원본 픽셀 좌표와 같도록 한다.
 
+        display는 뷰포트보다 훨씬 큰 이미지의 축소본 — 축소 보기에서 매 프레임
+        거대한 원본을 샘플링하지 않도록 대신 사용.
+        """
         self.clear_all()
 
-        self._pixmap_item = QGraphicsPixmapItem(pixmap)
-        self._pixmap_item.setZValue(0)
-        self._scene.addItem(self._pixmap_item)
-        self._scene.setSceneRect(self._pixmap_item.boundingRect())
+        self._bg_pixmap = pixmap
+        self._display_pixmap = display
+        self._scene.setSceneRect(0, 0, src_w, src_h)
+        self._img_w = src_w
+        self._img_h = src_h
+        self._markers_layer.set_image_rect(src_w, src_h)
 
         self._placeholder.setVisible(False)
 
         self._has_image = True
         self._current_zoom = 1.0
+        self.resetCachedContent()
         self.resetTransform()
-        self.fitInView(self._pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
-        return True
+        self.fitInView(self.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        self._on_transform_changed()
 
     def fit_view(self):
         """이미지를 뷰에 맞게 리셋 (원본 비율 Fit)."""
-        if self._has_image and self._pixmap_item:
+        if self._has_image:
             self._current_zoom = 1.0
             self.resetTransform()
-            self.fitInView(self._pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+            self.fitInView(self.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+            self._on_transform_changed()
+
+    def _on_transform_changed(self):
+        """변환이 바뀐 뒤 호출 — 캐시된 역변환 무효화, 마커 레이어에 배율 전달."""
+        self._view_to_scene = None
+        self._markers_layer.set_view_scale(self.transform().m11())
+
+    def _map_to_scene(self, pos: QPointF) -> QPointF:
+        """mapToScene과 동일 — 뷰포트 역변환은 바뀔 때만 다시 계산."""
+        if self._view_to_scene is None:
+            self._view_to_scene = self.viewportTransform().inverted()[0]
+        return self._view_to_scene.map(QPointF(pos.toPoint()))
+
+    def _in_image(self, x: int, y: int) -> bool:
+        """이미지 픽셀 좌표가 이미지 범위 안인지."""
+        return 0 <= x < self._img_w and 0 <= y < self._img_h
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        self._view_to_scene = None
+        super().scrollContentsBy(dx, dy)
 
     def clear_points(self):
         """Clear all markers (points and boxes)."""
-        for marker in self._markers:
-            marker.remove(self._scene)
-        self._markers.clear()
-
-        for marker in self._box_markers:
-            marker.remove(self._scene)
-        self._box_markers.clear()
+        self._remove_all_markers()
+        self.points_cleared.emit()
 
+    def _remove_all_markers(self):
+        """모든 마커 제거."""
+        self._markers_layer.clear()
         self._marker_history.clear()
-        self.points_cleared.emit()
+        self._emit_marker_count()
+
+    def _emit_marker_count(self):
+        """마커 추가/삭제 후 호출 — 현재 개수를 알림."""
+        self.marker_count_changed.emit(
+            self._markers_layer.point_count(), self._markers_layer.box_count()
+        )
 
     def undo_last_marker(self):
         """Remove most recent marker (Point or Box)."""
         if not self._marker_history:
             return
 
-        marker = self._marker_history.pop()
-
-        if isinstance(marker, PointMarker):
-            self._markers.remove(marker)
-        elif isinstance(marker, BoxMarker):
-            self._box_markers.remove(marker)
-
-        marker.remove(self._scene)
+        if self._marker_history.pop() is Mode.POINT:
+            self._markers_layer.pop_point()
+        else:
+            self._markers_layer.pop_box()
+        self._emit_marker_count()
         self.point_undone.emit()
 
     def clear_all(self):
         """이미지 + 포인트 모두 제거."""
-        self._coord_overlay.hide()
-        self._crosshair.hide()
-        for marker in self._markers:
-            marker.remove(self._scene)
-        self._markers.clear()
-
-        for marker in self._box_markers:
-            marker.remove(self._scene)
-        self._box_markers.clear()
-
-        self._marker_history.clear()
+        self._hide_hover()
+        self._remove_all_markers()
         self._cleanup_box_state()
 
-        if self._pixmap_item is not None:
-            self._scene.removeItem(self._pixmap_item)
-            self._pixmap_item = None
+        if self._bg_pixmap is not None:
+            self._bg_pixmap = None
+            self._display_pixmap = None
+            self.resetCachedContent()
 
         self._has_image = False
+        self._img_w = 0
+        self._img_h = 0
+        self._last_emit = (-1, -1)
         self._current_zoom = 1.0
         self.resetTransform()
+        self._on_transform_changed()
 
         self._placeholder.setVisible(True)
         self._center_placeholder()
 
     def get_points(self) -> list[tuple[int, int]]:
         """저장된 포인트 좌표 리스트 반환."""
-        return [(m.img_x, m.img_y) for m in self._markers]
+        return self._markers_layer.points()
 
     def get_boxes(self) -> list[tuple[int, int, int, int]]:
         """Return box coordinates as (x1, y1, x2, y2) list."""
-        return [(b.x1, b.y1, b.x2, b.y2) for b in self._box_markers]
+        return self._markers_layer.boxes()
+
+    def point_count(self) -> int:
+        """저장된 포인트 개수 (리스트를 만들지 않음)."""
+        return self._markers_layer.point_count()
+
+    def box_count(self) -> int:
+        """Return the number of boxes without building the list."""
+        return self._markers_layer.box_count()
 
     def has_image(self) -> bool:
         return self._has_image
@@ -605,49 +896,169 @@ class ImageCanvas(QGraphicsView):
         else:
             super().dropEvent(event)
 
+    # ──────────────────── Crosshair ────────────────────
+
+    def _crosshair_rects(self, pos: QPointF) -> tuple[QRect, QRect]:
+        """십자선 두 줄이 차지하는 뷰포트 영역 (펜 두께만큼 여유)."""
+        w = self._cross_pen.widthF()
+        h_line = QRectF(0, pos.y() - w, self._img_w, w * 2)
+        v_line = QRectF(pos.x() - w, 0, w * 2, self._img_h)
+        return (
+            self.mapFromScene(h_line).boundingRect().adjusted(-1, -1, 1, 1),
+            self.mapFromScene(v_line).boundingRect().adjusted(-1, -1, 1, 1),
+        )
+
+    def _set_crosshair(self, pos: QPointF | None):
+        """십자선 위치 갱신 — 이전/새 위치의 띠 영역만 다시 그림."""
+        if pos == self._cross_pos:
+            return
+        viewport = self.viewport()
+        if self._cross_pos is not None:
+            for rect in self._crosshair_rects(self._cross_pos):
+                viewport.update(rect)
+        self._cross_pos = None if pos is None else QPointF(pos)
+        if pos is not None:
+            for rect in self._crosshair_rects(pos):
+                viewport.update(rect)
+
+    def _hud_rect(self, pos: QPointF) -> QRect:
+        """좌표 표시가 차지할 수 있는 뷰포트 영역."""
+        origin = QPointF(self.mapFromScene(pos))
+        return self._hud.bounds.translated(origin).toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def _set_hud(self, pos: QPointF | None):
+        """좌표 표시 위치 갱신 — 이전/새 영역만 다시 그림."""
+        viewport = self.viewport()
+        if self._hud_pos is not None:
+            viewport.update(self._hud_rect(self._hud_pos))
+        self._hud_pos = None if pos is None else QPointF(pos)
+        if pos is not None:
+            viewport.update(self._hud_rect(pos))
+
+    def _hide_hover(self):
+        """좌표 표시와 십자선 숨김."""
+        self._set_hud(None)
+        self._set_crosshair(None)
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        """단색 배경 위에 이미지의 노출 영역만 그림.
+        현재 배율에 축소본 해상도로 충분하면 축소본을, 아니면 원본을 사용."""
+        super().drawBackground(painter, rect)
+        if self._bg_pixmap is None:
+            return
+        target = rect.intersected(QRectF(0, 0, self._img_w, self._img_h))
+        if target.isEmpty():
+            return
+        scale = self.transform().m11()
+        # 확대 보기는 최근접 샘플링(픽셀 확인용), 축소 보기만 부드럽게 보간.
+        # 배경 캐시용 painter는 뷰의 렌더 힌트를 물려받지 않으므로 여기서 설정
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, scale < 1.0)
+        pixmap = self._bg_pixmap
+        display = self._display_pixmap
+        # 씬 1픽셀당 필요한 화면 픽셀 수 ≤ 축소본이 가진 픽셀 수면 축소본 사용
+        if display is not None and (
+            scale * self.devicePixelRatioF() <= display.width() / self._img_w
+        ):
+            pixmap = display
+        # 씬(원본 픽셀) 좌표 → 픽스맵 픽셀 좌표
+        # (KeepAspectRatio 축소는 축마다 따로 반올림되므로 비율도 축별로)
+        kx = pixmap.width() / self._img_w
+        ky = pixmap.height() / self._img_h
+        source = QRectF(
+            target.x() * kx, target.y() * ky,
+            target.width() * kx, target.height() * ky,
+        )
+        painter.drawPixmap(target, pixmap, source)
+
+    def drawForeground(self, painter: QPainter, rect: QRectF):
+        if self._box_start is not None:
+            self._draw_box_preview(painter)
+        if self._cross_pos is not None:
+            self._draw_crosshair(painter, rect)
+        if self._hud_pos is not None:
+            # 좌표 표시는 줌 무관 — 뷰포트 픽셀 좌표로 그림
+            origin = painter.worldTransform().map(self._hud_pos)
+            painter.save()
+            painter.setWorldTransform(_IDENTITY)
+            self._hud.draw(painter, origin)
+            painter.restore()
+
+    def _draw_crosshair(self, painter: QPainter, rect: QRectF):
+        x, y = self._cross_pos.x(), self._cross_pos.y()
+        pen = self._cross_pen
+        w = pen.widthF()
+        # 노출 영역에 걸친 구간만 그림 — 점선 위상은 dashOffset으로 유지
+        left, right = max(rect.left(), 0.0), min(rect.right(), self._img_w)
+        if left < right and rect.top() - w <= y <= rect.bottom() + w:
+            pen.setDashOffset(left / w)
+            painter.setPen(pen)
+            painter.drawLine(QLineF(left, y, right, y))
+        top, bottom = max(rect.top(), 0.0), min(rect.bottom(), self._img_h)
+        if top < bottom and rect.left() - w <= x <= rect.right() + w:
+            pen.setDashOffset(top / w)
+            painter.setPen(pen)
+            painter.drawLine(QLineF(x, top, x, bottom))
+
     # ──────────────────── Mouse Events ────────────────────
 
     def mouseMoveEvent(self, event: QMouseEvent):
+        pos = event.position()  # 호출마다 새 QPointF가 생성되므로 한 번만 조회
         if self._is_panning:
-            delta = event.position() - self._pan_start
-            self._pan_start = event.position()
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - int(delta.x())
-            )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - int(delta.y())
-            )
+            delta = pos - self._pan_start
+            self._pan_start = pos
+            hbar = self.horizontalScrollBar()
+            hbar.setValue(hbar.value() - int(delta.x()))
+            vbar = self.verticalScrollBar()
+            vbar.setValue(vbar.value() - int(delta.y()))
             return
 
         if not self._has_image:
-            self._coord_overlay.hide()
-            self._crosshair.hide()
+            self._hide_hover()
+            return
+
+        # 패닝은 위에서 즉시 처리, 호버 표시는 타이머로 합쳐서 반영
+        self._pending_move_pos = pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+        super().mouseMoveEvent(event)
+
+    def _apply_pending_move(self):
+        """마지막 마우스 위치로 좌표 오버레이/십자선/Box 미리보기 갱신."""
+        pos = self._pending_move_pos
+        self._pending_move_pos = None
+        if pos is None or not self._has_image:
             return
 
-        scene_pos = self.mapToScene(event.position().toPoint())
+        # 씬 좌표 변환은 반영 시점에 한 번만 (그 사이 줌/스크롤도 반영)
+        scene_pos = self._map_to_scene(pos)
+
         img_x = int(scene_pos.x())
         img_y = int(scene_pos.y())
 
-        pixmap = self._pixmap_item.pixmap()
-        if 0 <= img_x < pixmap.width() and 0 <= img_y < pixmap.height():
-            self._coord_overlay.update(scene_pos, img_x, img_y)
-            self._crosshair.update(scene_pos, pixmap.width(), pixmap.height())
-            self.coord_changed.emit(img_x, img_y)
+        if self._in_image(img_x, img_y):
+            self._hud.set_coord(img_x, img_y)
+            self._set_hud(scene_pos)
+            self._set_crosshair(scene_pos)
+            # 같은 픽셀 안에서의 미세 이동은 알리지 않음
+            coord = (img_x, img_y)
+            if coord != self._last_emit:
+                self._last_emit = coord
+                self.coord_changed.emit(img_x, img_y)
 
             # Box mode: update preview if first click done
             if self._mode == Mode.BOX and self._box_start is not None:
                 self._update_box_preview(self._box_start, scene_pos)
         else:
-            self._coord_overlay.hide()
-            self._crosshair.hide()
-
-        super().mouseMoveEvent(event)
+            self._hide_hover()
 
     def mousePressEvent(self, event: QMouseEvent):
         if not self._has_image:
             super().mousePressEvent(event)
             return
 
+        pos = event.position()
+
         # 우클릭 → Box 취소 또는 마커 삭제
         if event.button() == Qt.MouseButton.RightButton:
             # Box mode: cancel in-progress box
@@ -664,21 +1075,20 @@ class ImageCanvas(QGraphicsView):
             and event.modifiers() & Qt.KeyboardModifier.ControlModifier
         ):
             self._is_panning = True
-            self._pan_start = event.position()
+            self._pan_start = pos
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             return
 
         # ── Point 모드 ──
         if self._mode == Mode.POINT:
             if event.button() == Qt.MouseButton.LeftButton:
-                scene_pos = self.mapToScene(event.position().toPoint())
+                scene_pos = self._map_to_scene(pos)
                 img_x = int(scene_pos.x())
                 img_y = int(scene_pos.y())
-                pixmap = self._pixmap_item.pixmap()
-                if 0 <= img_x < pixmap.width() and 0 <= img_y < pixmap.height():
-                    marker = PointMarker(self._scene, img_x, img_y)
-                    self._markers.append(marker)
-                    self._marker_history.append(marker)
+                if self._in_image(img_x, img_y):
+                    self._markers_layer.add_point(img_x, img_y)
+                    self._marker_history.append(Mode.POINT)
+                    self._emit_marker_count()
                     self.point_added.emit(img_x, img_y)
                 return
             super().mousePressEvent(event)
@@ -687,28 +1097,26 @@ class ImageCanvas(QGraphicsView):
         # ── Box 모드 ──
         if self._mode == Mode.BOX:
             if event.button() == Qt.MouseButton.LeftButton:
-                scene_pos = self.mapToScene(event.position().toPoint())
+                scene_pos = self._map_to_scene(pos)
                 img_x = int(scene_pos.x())
                 img_y = int(scene_pos.y())
-                pixmap = self._pixmap_item.pixmap()
 
-                if not (0 <= img_x < pixmap.width() and 0 <= img_y < pixmap.height()):
+                if not self._in_image(img_x, img_y):
                     return
 
                 if self._box_start is None:
                     # First click: start box
                     self._box_start = QPointF(img_x, img_y)
-                    self._create_temp_point(img_x, img_y)
-                    self._create_box_preview()
+                    self._invalidate_box_preview()
                 else:
                     # Second click: complete box
                     x1 = int(self._box_start.x())
                     y1 = int(self._box_start.y())
 
                     if img_x != x1 or img_y != y1:
-                        marker = BoxMarker(self._scene, x1, y1, img_x, img_y)
-                        self._box_markers.append(marker)
-                        self._marker_history.append(marker)
+                        self._markers_layer.add_box(x1, y1, img_x, img_y)
+                        self._marker_history.append(Mode.BOX)
+                        self._emit_marker_count()
                         self.point_added.emit(x1, y1)
 
                     self._cleanup_box_state()
@@ -719,7 +1127,7 @@ class ImageCanvas(QGraphicsView):
         # ── Hand 모드 ──
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_panning = True
-            self._pan_start = event.position()
+            self._pan_start = pos
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             return
 
@@ -728,12 +1136,7 @@ class ImageCanvas(QGraphicsView):
     def mouseReleaseEvent(self, event: QMouseEvent):
         if self._is_panning:
             self._is_panning = False
-            if self._mode == Mode.HAND:
-                self.setCursor(Qt.CursorShape.ArrowCursor)
-            elif self._mode == Mode.POINT:
-                self.setCursor(self._point_cursor)
-            else:  # Mode.BOX
-                self.setCursor(self._box_cursor)
+            self._restore_cursor()
             return
         super().mouseReleaseEvent(event)
 
@@ -748,21 +1151,33 @@ class ImageCanvas(QGraphicsView):
         # Point 모드에서는 이벤트를 소비하여 추가 포인트 방지
 
     def wheelEvent(self, event: QWheelEvent):
-        """마우스 휠로 줌 인/아웃."""
+        """마우스 휠로 줌 인/아웃 (연속 입력은 누적 후 한 번에 적용)."""
         if not self._has_image:
             return
 
-        if event.angleDelta().y() > 0:
-            factor = ZOOM_FACTOR
-        else:
-            factor = 1.0 / ZOOM_FACTOR
+        self._pending_wheel += event.angleDelta().y()
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            QTimer.singleShot(0, self._apply_wheel)
+
+    def _apply_wheel(self):
+        """누적된 휠 delta를 scale() 한 번으로 반영 (120 = 한 노치)."""
+        delta = self._pending_wheel
+        self._pending_wheel = 0
+        self._wheel_pending = False
+        if not self._has_image or delta == 0:
+            return
 
-        new_zoom = self._current_zoom * factor
-        if MIN_ZOOM <= new_zoom <= MAX_ZOOM:
+        new_zoom = self._current_zoom * ZOOM_FACTOR ** (delta / 120)
+        new_zoom = min(max(new_zoom, MIN_ZOOM), MAX_ZOOM)
+        factor = new_zoom / self._current_zoom
+        if factor != 1.0:
             self._current_zoom = new_zoom
             self.scale(factor, factor)
+            self._on_transform_changed()
 
     def leaveEvent(self, event):
-        self._coord_overlay.hide()
-        self._crosshair.hide()
+        self._move_timer.stop()
+        self._pending_move_pos = None
+        self._hide_hover()
         super().leaveEvent(event)
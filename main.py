@@ -11,6 +11,7 @@ Image Navigator - SAM3 개발 보조 도구.
 
 import sys
 import os
+import functools
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -27,10 +28,17 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction, QColor, QFont, QKeySequence
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
+from PySide6.QtGui import (
+    QAction,
+    QColor,
+    QFont,
+    QKeySequence,
+    QPalette,
+    QSurfaceFormat,
+)
 
-from canvas import ImageCanvas, Mode
+from canvas import ImageCanvas, Mode, MONO_FONT
 
 
 # (key, desc) 또는 ("__section__", title) 형태
@@ -57,6 +65,35 @@ SHORTCUTS = [
     ("Ctrl+좌클릭 드래그", "패닝 (이동)"),
 ]
 
+# 지원 이미지 확장자 — 드롭 검사와 파일 대화상자 필터가 공유
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif", ".webp")
+SUPPORTED_EXTS = frozenset(IMAGE_EXTS)
+IMAGE_FILTER = f"Images ({' '.join('*' + ext for ext in IMAGE_EXTS)});;All Files (*)"
+
+SHORTCUT_DIALOG_STYLE = """
+    QDialog {
+        background: #353535;
+    }
+    QTableWidget {
+        background: #2b2b2b;
+        color: #ddd;
+        border: none;
+        gridline-color: #444;
+        font-size: 13px;
+    }
+    QTableWidget::item {
+        padding: 6px 12px;
+    }
+    QHeaderView::section {
+        background: #3c3c3c;
+        color: #aaa;
+        border: 1px solid #444;
+        padding: 6px 12px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+"""
+
 
 class ShortcutDialog(QDialog):
     """단축키 가이드 팝업."""
@@ -65,31 +102,7 @@ class ShortcutDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Shortcut Guide")
         self.setMinimumSize(420, 400)
-        self.setStyleSheet(
-            """
-            QDialog {
-                background: #353535;
-            }
-            QTableWidget {
-                background: #2b2b2b;
-                color: #ddd;
-                border: none;
-                gridline-color: #444;
-                font-size: 13px;
-            }
-            QTableWidget::item {
-                padding: 6px 12px;
-            }
-            QHeaderView::section {
-                background: #3c3c3c;
-                color: #aaa;
-                border: 1px solid #444;
-                padding: 6px 12px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            """
-        )
+        self.setStyleSheet(SHORTCUT_DIALOG_STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -111,6 +124,9 @@ class ShortcutDialog(QDialog):
         section_font = QFont("Sans", 12, QFont.Weight.Bold)
         section_bg = QColor(60, 60, 60)
 
+        # 채우는 동안 정렬/다시 그리기를 멈췄다가 끝나면 한 번에 반영
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
         for row, (key, desc) in enumerate(SHORTCUTS):
             if key == "__section__":
                 # 섹션 헤더 행
@@ -126,9 +142,10 @@ class ShortcutDialog(QDialog):
                 table.setSpan(row, 0, 1, 2)
             else:
                 key_item = QTableWidgetItem(key)
-                key_item.setFont(QFont("Monospace", 13))
+                key_item.setFont(MONO_FONT)
                 table.setItem(row, 0, key_item)
                 table.setItem(row, 1, QTableWidgetItem(desc))
+        table.setUpdatesEnabled(True)
 
         layout.addWidget(table)
 
@@ -172,9 +189,67 @@ TOOLBAR_STYLE = """
     }
 """
 
+# 툴바 액션 — (이름, 텍스트, 단축키, 툴팁, MainWindow 슬롯 이름)
+TOOLBAR_ACTIONS = (
+    ("load", "Load Image", "Ctrl+O", "이미지 파일 로드 (Ctrl+O)", "_on_load_image"),
+    ("mode", "Cycle Mode", "P", "Hand / Point / Box 모드 전환 (P)", "_on_toggle_mode"),
+    ("point_reset", "All Points Reset", "Ctrl+R", "모든 포인트 제거 (Ctrl+R)", "_on_point_reset"),
+    ("fit", "Fit View", "F", "이미지 원본 비율로 맞추기 (F)", "_on_fit_view"),
+    ("shortcuts", "Shortcuts", "Ctrl+/", "단축키 가이드 (Ctrl+/)", "_on_show_shortcuts"),
+)
+
+STATUSBAR_STYLE = """
+    QStatusBar {
+        background: #2b2b2b;
+        color: #aaa;
+        border-top: 1px solid #444;
+        font-size: 12px;
+    }
+"""
+
+# 상태 라벨 텍스트 템플릿 (% 포맷)
+COORD_TEXT = "  x: %d  y: %d  "
+MARKER_COUNT_TEXT = "  Markers: %d (P:%d B:%d)  "
+
+COUNT_LABEL_STYLE = "color: #aaa; font-size: 13px; padding: 0 8px;"
+
+# 모드별 (라벨 텍스트, 라벨 스타일)
+MODE_LABELS = {
+    "hand": (
+        "  Now Mode: Hand  ",
+        "color: #8cf; font-size: 13px; font-weight: bold; padding: 0 8px;",
+    ),
+    "point": (
+        "  Now Mode: Point  ",
+        "color: #f66; font-size: 13px; font-weight: bold; padding: 0 8px;",
+    ),
+    "box": (
+        "  Now Mode: Box  ",
+        "color: #5f5; font-size: 13px; font-weight: bold; padding: 0 8px;",
+    ),
+}
+
+
+# 다크 테마 팔레트 — (역할, R, G, B)
+DARK_PALETTE = (
+    (QPalette.ColorRole.Window, 53, 53, 53),
+    (QPalette.ColorRole.WindowText, 200, 200, 200),
+    (QPalette.ColorRole.Base, 35, 35, 35),
+    (QPalette.ColorRole.AlternateBase, 53, 53, 53),
+    (QPalette.ColorRole.ToolTipBase, 25, 25, 25),
+    (QPalette.ColorRole.ToolTipText, 200, 200, 200),
+    (QPalette.ColorRole.Text, 200, 200, 200),
+    (QPalette.ColorRole.Button, 53, 53, 53),
+    (QPalette.ColorRole.ButtonText, 200, 200, 200),
+    (QPalette.ColorRole.BrightText, 255, 50, 50),
+    (QPalette.ColorRole.Link, 42, 130, 218),
+    (QPalette.ColorRole.Highlight, 42, 130, 218),
+    (QPalette.ColorRole.HighlightedText, 255, 255, 255),
+)
+
 
 class MainWindow(QMainWindow):
-    def __init__(self, initial_image: str | None = None):
+    def __init__(self):
         super().__init__()
         self.setWindowTitle("Image Navigator")
         self.setMinimumSize(800, 600)
@@ -184,6 +259,13 @@ class MainWindow(QMainWindow):
         self._canvas = ImageCanvas()
         self.setCentralWidget(self._canvas)
 
+        # 단축키 가이드 / 이미지 열기 대화상자 — 처음 열 때 생성
+        self._shortcut_dialog: ShortcutDialog | None = None
+        self._open_dialog: QFileDialog | None = None
+
+        # 마커 개수 라벨에 표시 중인 (포인트 수, Box 수)
+        self._last_marker_counts: tuple[int, int] | None = None
+
         # Toolbar
         self._setup_toolbar()
 
@@ -192,15 +274,20 @@ class MainWindow(QMainWindow):
 
         # 시그널 연결
         self._canvas.coord_changed.connect(self._on_coord_changed)
-        self._canvas.point_added.connect(self._on_point_added)
-        self._canvas.point_undone.connect(self._update_point_count)
-        self._canvas.points_cleared.connect(self._on_points_cleared)
+        self._canvas.marker_count_changed.connect(self._update_point_count)
         self._canvas.image_dropped.connect(self._on_image_dropped)
+        self._canvas.image_loaded.connect(self._on_image_loaded)
+        self._canvas.image_load_failed.connect(self._on_image_load_failed)
         self._canvas.mode_changed.connect(self._on_mode_changed)
 
-        # 초기 이미지 로드
-        if initial_image and os.path.isfile(initial_image):
-            self._load_image(initial_image)
+    def deferred_init(self, initial_image: str | None = None):
+        """창을 띄운 뒤 호출 — 초기 이미지 로드는 다음 이벤트 루프 턴으로 미룸.
+
+        뷰포트가 실제 크기를 가진 뒤 로드하므로 축소본 크기도 맞게 계산된다.
+        """
+        # 존재/형식 확인은 로더가 담당 — 실패 시 image_load_failed로 경고
+        if initial_image:
+            QTimer.singleShot(0, lambda: self._load_image(initial_image))
 
     def _setup_toolbar(self):
         toolbar = QToolBar("Main Toolbar")
@@ -208,58 +295,41 @@ class MainWindow(QMainWindow):
         toolbar.setStyleSheet(TOOLBAR_STYLE)
         self.addToolBar(toolbar)
 
-        # Load Image
-        load_action = QAction("Load Image", self)
-        load_action.setShortcut(QKeySequence("Ctrl+O"))
-        load_action.setToolTip("이미지 파일 로드 (Ctrl+O)")
-        load_action.triggered.connect(self._on_load_image)
-        toolbar.addAction(load_action)
+        # 액션 생성 (TOOLBAR_ACTIONS 표 기준)
+        self._actions: dict[str, QAction] = {}
+        for name, text, key, tip, slot in TOOLBAR_ACTIONS:
+            action = QAction(text, self)
+            action.setShortcut(QKeySequence(key))
+            action.setToolTip(tip)
+            action.triggered.connect(getattr(self, slot))
+            self._actions[name] = action
 
+        toolbar.addAction(self._actions["load"])
         toolbar.addSeparator()
 
         # 모드 사이클 토글 (checkable)
-        self._point_action = QAction("Cycle Mode", self)
+        self._point_action = self._actions["mode"]
         self._point_action.setCheckable(True)
-        self._point_action.setShortcut(QKeySequence("P"))
-        self._point_action.setToolTip("Hand / Point / Box 모드 전환 (P)")
-        self._point_action.triggered.connect(self._on_toggle_mode)
         toolbar.addAction(self._point_action)
-
+        # 모드 변경마다 위젯 트리를 검색하지 않도록 버튼 참조 보관
+        self._mode_button = toolbar.widgetForAction(self._point_action)
         # 버튼에 ObjectName 설정하여 스타일 적용
-        mode_button = toolbar.widgetForAction(self._point_action)
-        if mode_button:
-            mode_button.setObjectName("mode_button_point")
+        if self._mode_button:
+            self._mode_button.setObjectName("mode_button_point")
 
         toolbar.addSeparator()
-
-        # All Points Reset
-        point_reset_action = QAction("All Points Reset", self)
-        point_reset_action.setShortcut(QKeySequence("Ctrl+R"))
-        point_reset_action.setToolTip("모든 포인트 제거 (Ctrl+R)")
-        point_reset_action.triggered.connect(self._on_point_reset)
-        toolbar.addAction(point_reset_action)
-
-        # Fit View
-        fit_action = QAction("Fit View", self)
-        fit_action.setShortcut(QKeySequence("F"))
-        fit_action.setToolTip("이미지 원본 비율로 맞추기 (F)")
-        fit_action.triggered.connect(self._on_fit_view)
-        toolbar.addAction(fit_action)
-
+        toolbar.addAction(self._actions["point_reset"])
+        toolbar.addAction(self._actions["fit"])
         toolbar.addSeparator()
 
         # 포인트 카운트 라벨
         self._point_count_label = QLabel("  Points: 0  ")
-        self._point_count_label.setStyleSheet(
-            "color: #aaa; font-size: 13px; padding: 0 8px;"
-        )
+        self._point_count_label.setStyleSheet(COUNT_LABEL_STYLE)
         toolbar.addWidget(self._point_count_label)
 
         # 모드 표시 라벨
         self._mode_label = QLabel("  Hand  ")
-        self._mode_label.setStyleSheet(
-            "color: #8cf; font-size: 13px; font-weight: bold; padding: 0 8px;"
-        )
+        self._mode_label.setStyleSheet(MODE_LABELS["hand"][1])
         toolbar.addWidget(self._mode_label)
 
         # 스페이서
@@ -267,37 +337,28 @@ class MainWindow(QMainWindow):
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         toolbar.addWidget(spacer)
 
-        # Shortcut Guide
-        shortcut_action = QAction("Shortcuts", self)
-        shortcut_action.setShortcut(QKeySequence("Ctrl+/"))
-        shortcut_action.setToolTip("단축키 가이드 (Ctrl+/)")
-        shortcut_action.triggered.connect(self._on_show_shortcuts)
-        toolbar.addAction(shortcut_action)
+        toolbar.addAction(self._actions["shortcuts"])
 
     def _setup_statusbar(self):
         status_bar = QStatusBar()
-        status_bar.setStyleSheet(
-            """
-            QStatusBar {
-                background: #2b2b2b;
-                color: #aaa;
-                border-top: 1px solid #444;
-                font-size: 12px;
-            }
-            """
-        )
+        status_bar.setStyleSheet(STATUSBAR_STYLE)
         self.setStatusBar(status_bar)
+        # 좌표는 자주 바뀌므로 영구 위젯 대신 상태바 메시지로 표시
+        self._status_bar = status_bar
+        status_bar.showMessage("Ready — Load an image or drag & drop")
 
-        self._coord_label = QLabel("Ready — Load an image or drag & drop")
-        self._coord_label.setFont(QFont("Monospace", 11))
-        status_bar.addPermanentWidget(self._coord_label)
-
+        # 파일 경로는 로드 시에만 바뀜 — 메시지에 가려지지 않도록 영구 위젯
         self._file_label = QLabel("")
-        status_bar.addWidget(self._file_label)
+        status_bar.addPermanentWidget(self._file_label)
 
     # ──────────────────── Actions ────────────────────
 
     def _on_load_image(self):
+        # 파일을 고른 뒤에만 교체 확인 — 선택 취소 시 확인 대화상자 생략
+        file_path = self._choose_image_file()
+        if not file_path:
+            return
+
         if self._canvas.has_image():
             reply = QMessageBox.question(
                 self,
@@ -308,20 +369,25 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open Image",
-            "",
-            "Images (*.png *.jpg *.jpeg *.bmp *.tiff *.tif *.webp);;All Files (*)",
-        )
-        if file_path:
-            self._load_image(file_path)
-
+        self._load_image(file_path)
+
+    def _choose_image_file(self) -> str:
+        """이미지 열기 대화상자 — 한 번 만든 대화상자를 재사용 (마지막 폴더 유지)."""
+        if self._open_dialog is None:
+            self._open_dialog = QFileDialog(self, "Open Image", "", IMAGE_FILTER)
+            self._open_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._open_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        self._open_dialog.selectFile("")
+        if not self._open_dialog.exec():
+            return ""
+        files = self._open_dialog.selectedFiles()
+        return files[0] if files else ""
+
+    @Slot(str)
     def _on_image_dropped(self, path: str):
         """드래그 앤 드롭으로 이미지 로드."""
         ext = os.path.splitext(path)[1].lower()
-        supported = {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif", ".webp"}
-        if ext not in supported:
+        if ext not in SUPPORTED_EXTS:
             QMessageBox.warning(
                 self, "Error", f"지원하지 않는 파일 형식: {ext}\n{path}"
             )
@@ -329,102 +395,126 @@ class MainWindow(QMainWindow):
         self._load_image(path)
 
     def _load_image(self, path: str):
-        if self._canvas.load_image(path):
-            filename = os.path.basename(path)
-            self.setWindowTitle(f"Image Navigator - {filename}")
-            self._file_label.setText(f"  {path}")
-            self._update_point_count()
-        else:
-            QMessageBox.warning(self, "Error", f"이미지를 로드할 수 없습니다:\n{path}")
+        """이미지 로드 요청 (비동기).
+
+        워커 스레드에서 QImage로 한 번만 디코딩하고, GUI 스레드에서 QPixmap으로
+        한 번 변환해 캔버스가 보관한다 — 그리기 경로는 QPixmap만 사용.
+        결과는 _on_image_loaded / _on_image_load_failed로 전달된다.
+        """
+        self._canvas.load_image(path)
+
+    @Slot(str)
+    def _on_image_loaded(self, path: str):
+        filename = os.path.basename(path)
+        self.setWindowTitle(f"Image Navigator - {filename}")
+        self._file_label.setText(f"  {path}")
+
+    @Slot(str)
+    def _on_image_load_failed(self, path: str):
+        QMessageBox.warning(self, "Error", f"이미지를 로드할 수 없습니다:\n{path}")
 
     def _on_toggle_mode(self):
         self._canvas.toggle_mode()
 
     def _on_point_reset(self):
         self._canvas.clear_points()
-        self._update_point_count()
 
     def _on_fit_view(self):
         self._canvas.fit_view()
 
     def _on_show_shortcuts(self):
-        dialog = ShortcutDialog(self)
-        dialog.show()
+        # 처음 열 때 한 번만 생성하고 이후에는 재사용
+        if self._shortcut_dialog is None:
+            self._shortcut_dialog = ShortcutDialog(self)
+        self._shortcut_dialog.show()
+        self._shortcut_dialog.raise_()
+        self._shortcut_dialog.activateWindow()
 
     # ──────────────────── Signals ────────────────────
 
+    @Slot(int, int)
     def _on_coord_changed(self, x: int, y: int):
-        self._coord_label.setText(f"  x: {x}  y: {y}  ")
-
-    def _on_point_added(self, x: int, y: int):
-        self._update_point_count()
-
-    def _on_points_cleared(self):
-        self._update_point_count()
+        self._status_bar.showMessage(COORD_TEXT % (x, y))
 
+    @Slot(str)
     def _on_mode_changed(self, mode_str: str):
-        mode_button = self.findChild(QToolBar).widgetForAction(self._point_action)
+        mode_button = self._mode_button
+        text, style = MODE_LABELS[mode_str]
+        self._mode_label.setText(text)
+        self._mode_label.setStyleSheet(style)
 
         if mode_str == "hand":
-            self._mode_label.setText("  Now Mode: Hand  ")
-            self._mode_label.setStyleSheet(
-                "color: #8cf; font-size: 13px; font-weight: bold; padding: 0 8px;"
-            )
             self._point_action.setChecked(False)
         elif mode_str == "point":
-            self._mode_label.setText("  Now Mode: Point  ")
-            self._mode_label.setStyleSheet(
-                "color: #f66; font-size: 13px; font-weight: bold; padding: 0 8px;"
-            )
             self._point_action.setChecked(True)
             if mode_button:
                 mode_button.setObjectName("mode_button_point")
                 mode_button.setStyleSheet("")  # Reset to trigger re-evaluation
         else:  # mode_str == "box"
-            self._mode_label.setText("  Now Mode: Box  ")
-            self._mode_label.setStyleSheet(
-                "color: #5f5; font-size: 13px; font-weight: bold; padding: 0 8px;"
-            )
             self._point_action.setChecked(True)
             if mode_button:
                 mode_button.setObjectName("mode_button_box")
                 mode_button.setStyleSheet("")  # Reset to trigger re-evaluation
 
-    def _update_point_count(self):
-        point_count = len(self._canvas.get_points())
-        box_count = len(self._canvas.get_boxes())
-        total = point_count + box_count
-        self._point_count_label.setText(f"  Markers: {total} (P:{point_count} B:{box_count})  ")
+    @Slot(int, int)
+    def _update_point_count(self, point_count: int, box_count: int):
+        # 개수가 그대로면 (빈 상태에서 리셋/이미지 교체 등) 라벨 갱신 생략
+        counts = (point_count, box_count)
+        if counts == self._last_marker_counts:
+            return
+        self._last_marker_counts = counts
+        self._point_count_label.setText(
+            MARKER_COUNT_TEXT % (point_count + box_count, point_count, box_count)
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _make_palette() -> QPalette:
+    """다크 테마 팔레트 (한 번만 생성)."""
+    palette = QPalette()
+    for role, r, g, b in DARK_PALETTE:
+        palette.setColor(role, QColor(r, g, b))
+    return palette
+
+
+def _drain_image_loads():
+    pool = QThreadPool.globalInstance()
+    pool.clear()
+    pool.waitForDone()
 
 
 def main():
+    # OpenGL 뷰포트 기본 포맷 — QApplication 생성 전에 설정해야 함
+    fmt = QSurfaceFormat()
+    fmt.setRedBufferSize(8)
+    fmt.setGreenBufferSize(8)
+    fmt.setBlueBufferSize(8)
+    fmt.setAlphaBufferSize(8)
+    fmt.setSwapInterval(1)
+    QSurfaceFormat.setDefaultFormat(fmt)
+
+    # 연속 마우스 이동/휠 이벤트를 이벤트 루프에서 합쳐 최신 것만 전달
+    # (플랫폼 기본값에 맡기지 않고 명시)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+
     app = QApplication(sys.argv)
 
     # 다크 테마 기본 적용
     app.setStyle("Fusion")
-    from PySide6.QtGui import QPalette, QColor
+    app.setPalette(_make_palette())
 
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(200, 200, 200))
-    palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(25, 25, 25))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(200, 200, 200))
-    palette.setColor(QPalette.ColorRole.Text, QColor(200, 200, 200))
-    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(200, 200, 200))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 50, 50))
-    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    app.setPalette(palette)
+    # 종료 시 대기 중인 디코딩은 버리고 진행 중인 작업은 끝날 때까지 대기
+    # (창이 먼저 파괴된 뒤 워커가 시그널을 보내지 않도록)
+    app.aboutToQuit.connect(_drain_image_loads)
 
     # 커맨드라인 인자로 이미지 경로 받기
     initial_image = sys.argv[1] if len(sys.argv) > 1 else None
 
-    window = MainWindow(initial_image=initial_image)
+    window = MainWindow()
     window.show()
+    # 빈 창을 먼저 그린 뒤 초기 이미지 로드
+    app.processEvents()
+    window.deferred_init(initial_image)
     sys.exit(app.exec())
 
 